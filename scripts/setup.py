@@ -1,30 +1,14 @@
 #!/usr/bin/env python
+import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
 from loguru import logger
 
-def create_directory_structure():
-    """Create the project directory structure."""
-    directories = [
-        "data/raw",
-        "data/processed",
-        "data/cache",
-        "logs",
-        "models",
-        "plots",
-        "notebooks",
-        "config",
-    ]
-    
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created directory: {directory}")
-
-def create_env_file():
-    """Create .env file with default values."""
-    env_content = """
+# File templates, stripped and encoded once at import
+_ENV = """
 # API Keys (DO NOT COMMIT ACTUAL KEYS)
 ALPHA_VANTAGE_API_KEY=your_key_here
 POLYGON_API_KEY=your_key_here
@@ -57,15 +41,9 @@ BACKTEST_START_DATE=2020-01-01
 BACKTEST_END_DATE=2023-12-31
 COMMISSION_RATE=0.001
 SLIPPAGE=0.0005
-"""
-    
-    with open(".env", "w") as f:
-        f.write(env_content.strip())
-    logger.info("Created .env file")
+""".strip().encode("utf-8")
 
-def create_config_file():
-    """Create config.yaml file with default values."""
-    config_content = """
+_CONFIG = """
 # Trading System Configuration
 
 # Data Management
@@ -155,16 +133,9 @@ visualization:
   palette: deep
   dpi: 300
   save_dir: plots/
-"""
-    
-    config_path = Path("config/config.yaml")
-    with open(config_path, "w") as f:
-        f.write(config_content.strip())
-    logger.info(f"Created {config_path}")
+""".strip().encode("utf-8")
 
-def create_gitignore():
-    """Create .gitignore file if it doesn't exist."""
-    gitignore_content = """
+_GITIGNORE = """
 # Python
 __pycache__/
 *.py[cod]
@@ -225,11 +196,57 @@ plots/
 # OS
 .DS_Store
 Thumbs.db
-"""
+""".strip().encode("utf-8")
+
+def create_directory_structure():
+    """Create the project directory structure."""
+    directories = [
+        "data/raw",
+        "data/processed",
+        "data/cache",
+        "logs",
+        "models",
+        "plots",
+        "notebooks",
+        "config",
+    ]
+    
+    # A stat is cheaper than a mkdir that fails with EEXIST
+    missing = [d for d in directories if not os.path.isdir(d)]
+    if not missing:
+        logger.info("All directories already exist")
+        return
     
-    with open(".gitignore", "w") as f:
-        f.write(gitignore_content.strip())
-    logger.info("Created .gitignore")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda d: os.makedirs(d, exist_ok=True), missing))
+    logger.info(f"Created {len(missing)} directories: {', '.join(missing)}")
+
+def create_env_file():
+    """Create .env file with default values."""
+    with open(".env", "wb") as f:
+        f.write(_ENV)
+    return [".env"]
+
+def create_config_file():
+    """Create config.yaml file with default values."""
+    config_path = Path("config/config.yaml")
+    with open(config_path, "wb") as f:
+        f.write(_CONFIG)
+    
+    # Precompiled snapshot, loaded by ConfigManager instead of parsing YAML
+    # while config.yaml keeps the (mtime_ns, size) stamp stored with it
+    st = config_path.stat()
+    snapshot_path = Path("config/config.yaml.json")
+    snapshot = {"source": [st.st_mtime_ns, st.st_size], "config": yaml.safe_load(_CONFIG)}
+    with open(snapshot_path, "wb") as f:
+        f.write(json.dumps(snapshot).encode())
+    return [str(config_path), str(snapshot_path)]
+
+def create_gitignore():
+    """Create .gitignore file if it doesn't exist."""
+    with open(".gitignore", "wb") as f:
+        f.write(_GITIGNORE)
+    return [".gitignore"]
 
 def main():
     """Main setup function."""
@@ -238,12 +255,15 @@ def main():
     # Create directory structure
     create_directory_structure()
     
-    # Create configuration files
-    create_env_file()
-    create_config_file()
-    
-    # Create .gitignore
-    create_gitignore()
+    # Create configuration files and .gitignore; they are disjoint, so
+    # write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(create)
+            for create in (create_env_file, create_config_file, create_gitignore)
+        ]
+        created = [path for future in futures for path in future.result()]
+    logger.info(f"Created {', '.join(created)}")
     
     logger.info("Project setup completed successfully!")
 
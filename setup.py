@@ -1,3 +1,4 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
 setup(
@@ -33,13 +34,12 @@ setup(
         "black>=23.7.0",
         "flake8>=6.1.0",
         "pyyaml>=6.0.1",
-        "pydantic>=2.0.0",
     ],
     python_requires=">=3.8",
     author="Your Name",
     author_email="your.email@example.com",
     description="A trading system with machine learning capabilities",
-    long_description=open("README.md").read(),
+    long_description=Path("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/trading",
     classifiers=[
@@ -1,7 +1,136 @@
+import functools
+import json
 import os
 import yaml
-from typing import Dict, Any, Optional
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple
 from loguru import logger
+from .env import load_dotenv_once
+from .file_cache import load_cached, read_file
+from .lazy import LazyProxy
+
+# Prefer the libyaml bindings, fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+def _parse_yaml(stream: Any) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_Loader)
+
+def _read_yaml(path: str) -> Any:
+    """Read and parse a YAML config file."""
+    # libyaml decodes the raw bytes itself
+    return _parse_yaml(read_file(path))
+
+def _read_snapshot(path: str) -> Any:
+    """Read a YAML config file, preferring its JSON snapshot when current.
+    
+    The snapshot lives next to the YAML file (config/config.yaml.json for
+    config/config.yaml) and is only used if it already exists, as
+    created by scripts/setup.py. It stores the (mtime_ns, size) stamp of
+    the YAML file it was built from and is used only while the YAML file
+    still has exactly that stamp. Otherwise the YAML file is parsed and
+    the snapshot rewritten.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed configuration
+    """
+    snapshot = path + ".json"
+    # Stat before reading, so the stamp never describes newer contents
+    # than the ones parsed
+    st = os.stat(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    try:
+        cached = json.loads(read_file(snapshot))
+        if cached["source"] == stamp:
+            return cached["config"]
+    except FileNotFoundError:
+        return _read_yaml(path)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config snapshot {snapshot}: {e}")
+    
+    data = _read_yaml(path)
+    
+    # Skip the write if the file changed while it was parsed, as the
+    # snapshot would be out of date before it landed
+    st = os.stat(path)
+    if [st.st_mtime_ns, st.st_size] != stamp:
+        return data
+    
+    # Skip configs that JSON cannot hold unchanged, such as dates or
+    # non-string keys
+    try:
+        blob = json.dumps({"source": stamp, "config": data}).encode()
+    except (TypeError, ValueError):
+        return data
+    if json.loads(blob)["config"] != data:
+        return data
+    
+    # Write to a private temporary file and rename it into place, so
+    # concurrently starting workers never see a partial snapshot
+    tmp = f"{snapshot}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, snapshot)
+    except OSError as e:
+        logger.debug(f"Could not write config snapshot {snapshot}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    
+    return data
+
+# Dotted keys already split into their parts. Bounded so that
+# dynamically built keys cannot grow it without limit.
+_KEY_CACHE: Dict[str, Tuple[str, ...]] = {}
+_KEY_CACHE_SIZE = 1024
+
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted key, reusing the tuple for keys seen before."""
+    parts = _KEY_CACHE.get(key)
+    if parts is None:
+        parts = tuple(key.split("."))
+        if len(_KEY_CACHE) < _KEY_CACHE_SIZE:
+            _KEY_CACHE[key] = parts
+    return parts
+
+# Marks keys missing from get() where None could be a real value
+_MISSING = object()
+
+class ConfigView:
+    """Live attribute-access view of a nested configuration dict.
+    
+    Nested dicts are wrapped again on access, and missing keys raise
+    AttributeError, so getattr(view, name, default) works as usual.
+    """
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: Dict[str, Any]):
+        """Initialize the view.
+        
+        Args:
+            data: Configuration dict to read from
+        """
+        self._data = data
+    
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return ConfigView(value) if isinstance(value, dict) else value
+    
+    def __repr__(self) -> str:
+        return f"ConfigView({self._data!r})"
 
 class ConfigManager:
     """Manages configuration settings for the trading system.
@@ -12,6 +141,15 @@ class ConfigManager:
     3. Default values
     """
     
+    __slots__ = (
+        "config_path",
+        "config",
+        "_dirty",
+        "_saved_hash",
+        "_path_cache",
+        "_mkdir_cache",
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration manager.
         
@@ -19,8 +157,17 @@ class ConfigManager:
             config_path: Optional path to config file. If not provided,
                         will look for config.yaml in the config directory.
         """
+        # The defaults below read API keys from the environment
+        load_dotenv_once()
         self.config_path = config_path or os.path.join("config", "config.yaml")
         self.config: Dict[str, Any] = {}
+        # Change tracking used to skip no-op saves
+        self._dirty = False
+        self._saved_hash: Optional[int] = None
+        # Paths resolved by get_path with the values they were built
+        # from, and directories it already ensured
+        self._path_cache: Dict[str, Tuple[Any, Path]] = {}
+        self._mkdir_cache: Set[Path] = set()
         self._load_config()
     
     def _load_config(self) -> None:
@@ -52,14 +199,16 @@ class ConfigManager:
         # Load from config file if it exists
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, "r") as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config:
-                        self._update_config(file_config)
+                file_config = load_cached(self.config_path, _read_snapshot)
+                if file_config:
+                    self._update_config(file_config)
             else:
                 logger.warning(f"Config file not found at {self.config_path}, using defaults")
         except Exception as e:
             logger.error(f"Error loading config file: {e}")
+        
+        self._dirty = False
+        self._saved_hash = hash(repr(self.config))
     
     def _update_config(self, new_config: Dict[str, Any]) -> None:
         """Update configuration with new values.
@@ -67,14 +216,15 @@ class ConfigManager:
         Args:
             new_config: New configuration values
         """
-        def update_dict(d: Dict[str, Any], u: Dict[str, Any]) -> None:
+        pending = deque([(self.config, new_config)])
+        while pending:
+            d, u = pending.popleft()
             for k, v in u.items():
                 if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                    update_dict(d[k], v)
+                    pending.append((d[k], v))
                 else:
                     d[k] = v
         
-        update_dict(self.config, new_config)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
@@ -86,16 +236,53 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
+        # Walk the live dict, so edits made through returned dicts or
+        # self.config are always seen. A flat dotted-key index would be a
+        # single lookup, but it cannot notice those edits and goes stale.
         value = self.config
-        
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
             return value
         except (KeyError, TypeError):
             return default
     
+    def get_path(self, key: str) -> Path:
+        """Get a configured path, making sure its directory exists.
+        
+        Keys ending in "_dir" name directories, which are created
+        themselves. Any other key names a file, whose parent directory
+        is created. The Path is reused while the configured value stays
+        the same, and each directory is checked once per instance.
+        
+        Args:
+            key: Configuration key (dot-separated for nested keys)
+            
+        Returns:
+            Configured path
+            
+        Raises:
+            KeyError: If key not found
+        """
+        value = self.get(key)
+        if value is None:
+            raise KeyError(f"Configuration key not found: {key}")
+        
+        # Compare against the live value, which may have been edited in place
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        
+        path = Path(value)
+        directory = path if key.endswith("_dir") else path.parent
+        if directory not in self._mkdir_cache:
+            # access() is a cheaper probe than a mkdir failing with EEXIST
+            if not os.access(directory, os.F_OK):
+                directory.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(directory)
+        self._path_cache[key] = (value, path)
+        return path
+    
     def set(self, key: str, value: Any) -> None:
         """Set configuration value.
         
@@ -103,7 +290,7 @@ class ConfigManager:
             key: Configuration key (dot-separated for nested keys)
             value: Value to set
         """
-        keys = key.split(".")
+        keys = _split_key(key)
         config = self.config
         
         for k in keys[:-1]:
@@ -112,13 +299,36 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._dirty = True
+    
+    @property
+    def ns(self) -> ConfigView:
+        """Attribute-access view of the configuration.
+        
+        Example: config.ns.logging.level. The view reads the live
+        configuration, so it reflects every change, including edits made
+        in place.
+        """
+        return ConfigView(self.config)
     
     def save(self) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file.
+        
+        Does nothing if the file exists and the configuration has not
+        changed since it was loaded or last saved.
+        """
+        # The hash also catches in-place edits of nested dicts
+        config_hash = hash(repr(self.config))
+        if (not self._dirty and config_hash == self._saved_hash
+                and os.path.exists(self.config_path)):
+            return
+        
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             with open(self.config_path, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=_Dumper, default_flow_style=False)
+            self._dirty = False
+            self._saved_hash = config_hash
         except Exception as e:
             logger.error(f"Error saving config file: {e}")
     
@@ -134,7 +344,10 @@ class ConfigManager:
         Raises:
             KeyError: If key not found
         """
-        return self.get(key)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
     
     def __setitem__(self, key: str, value: Any) -> None:
         """Set configuration value using dictionary syntax.
@@ -144,9 +357,29 @@ class ConfigManager:
             value: Value to set
         """
         self.set(key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        """Check whether a configuration key is set.
+        
+        Args:
+            key: Configuration key (dot-separated for nested keys)
+            
+        Returns:
+            True if the key is set
+        """
+        return self.get(key, _MISSING) is not _MISSING
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the shared configuration manager, created once per process.
+    
+    Returns:
+        Process-wide ConfigManager instance
+    """
+    return ConfigManager()
 
-# Create global config instance
-config = ConfigManager()
+# Global config instance, created on first use
+config = LazyProxy(get_config)
 
 # Example usage:
 # from trading.utils.config import config
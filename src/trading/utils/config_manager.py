@@ -1,34 +1,81 @@
+import functools
 import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
-import yaml
-from pydantic import BaseModel, Field, field_validator
-from dotenv import load_dotenv
-from loguru import logger
+from typing import Any, Dict, Optional, Union, List, get_args, get_origin
 import json
+from .env import load_dotenv_once
+from .file_cache import load_cached, read_file
+from .lazy import LazyProxy
 
-# Load environment variables
-load_dotenv()
+def _log():
+    """Get the loguru logger, imported only when something is logged."""
+    from loguru import logger
+    return logger
 
-class APIConfig(BaseModel):
+def _convert(name: str, value: Any, kind: type) -> Any:
+    """Convert a config value to kind, accepting the inputs Pydantic did.
+    
+    Numeric strings and whole floats are converted, anything else of
+    the wrong type is rejected.
+    
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    if kind is str:
+        ok = isinstance(value, str)
+    elif kind is int:
+        ok = isinstance(value, (int, str)) or (isinstance(value, float) and value.is_integer())
+    else:
+        ok = isinstance(value, (int, float, str))
+    if ok:
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    raise ValueError(f"{name} must be of type {kind.__name__}, got {value!r}")
+
+def _convert_fields(config: Any) -> None:
+    """Convert every field of a config dataclass to its annotated type.
+    
+    Raises:
+        ValueError: If a field cannot be converted
+    """
+    for f in fields(config):
+        value = getattr(config, f.name)
+        if get_origin(f.type) is dict:
+            if not isinstance(value, dict):
+                raise ValueError(f"{f.name} must be a dict, got {value!r}")
+            kind = get_args(f.type)[1]
+            value = {k: _convert(f"{f.name}.{k}", v, kind) for k, v in value.items()}
+        else:
+            value = _convert(f.name, value, f.type)
+        # Frozen dataclasses can only be assigned through object
+        object.__setattr__(config, f.name, value)
+
+@dataclass(frozen=True)
+class APIConfig:
     """API configuration with validation."""
-    timeout: int = Field(default=10, ge=1, le=60)
-    retries: int = Field(default=3, ge=1, le=10)
-    rate_limit: int = Field(default=2000, ge=1)
-    
-    @field_validator('timeout')
-    @classmethod
-    def validate_timeout(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError("Timeout must be at least 1 second")
-        return v
+    timeout: int = 10
+    retries: int = 3
+    rate_limit: int = 2000
+    
+    def __post_init__(self) -> None:
+        _convert_fields(self)
+        if not 1 <= self.timeout <= 60:
+            raise ValueError("Timeout must be between 1 and 60 seconds")
+        if not 1 <= self.retries <= 10:
+            raise ValueError("Retries must be between 1 and 10")
+        if self.rate_limit < 1:
+            raise ValueError("Rate limit must be at least 1")
 
-class DatabaseConfig(BaseModel):
+@dataclass(frozen=True)
+class DatabaseConfig:
     """Database configuration with validation."""
-    host: str = Field(default="localhost")
-    port: int = Field(default=27017, ge=1, le=65535)
-    name: str = Field(default="trading")
-    collections: Dict[str, str] = Field(
+    host: str = "localhost"
+    port: int = 27017
+    name: str = "trading"
+    collections: Dict[str, str] = field(
         default_factory=lambda: {
             "raw_data": "raw_data",
             "processed_data": "processed_data",
@@ -36,54 +83,68 @@ class DatabaseConfig(BaseModel):
             "model_metrics": "model_metrics"
         }
     )
+    
+    def __post_init__(self) -> None:
+        _convert_fields(self)
+        if not 1 <= self.port <= 65535:
+            raise ValueError("Port must be between 1 and 65535")
 
-class StrategyConfig(BaseModel):
+@dataclass(frozen=True)
+class StrategyConfig:
     """Strategy configuration with validation."""
-    moving_averages: Dict[str, int] = Field(
+    moving_averages: Dict[str, int] = field(
         default_factory=lambda: {
             "short_window": 20,
             "long_window": 50
         }
     )
-    rsi: Dict[str, int] = Field(
+    rsi: Dict[str, int] = field(
         default_factory=lambda: {
             "period": 14,
             "overbought": 70,
             "oversold": 30
         }
     )
-    macd: Dict[str, int] = Field(
+    macd: Dict[str, int] = field(
         default_factory=lambda: {
             "fast_period": 12,
             "slow_period": 26,
             "signal_period": 9
         }
     )
-
-    @field_validator('moving_averages')
-    @classmethod
-    def validate_moving_averages(cls, v: Dict[str, int]) -> Dict[str, int]:
-        if v['short_window'] >= v['long_window']:
+    
+    def __post_init__(self) -> None:
+        _convert_fields(self)
+        missing = {'short_window', 'long_window'} - self.moving_averages.keys()
+        if missing:
+            raise ValueError(f"moving_averages is missing {', '.join(sorted(missing))}")
+        if self.moving_averages['short_window'] >= self.moving_averages['long_window']:
             raise ValueError("Short window must be less than long window")
-        return v
 
-class MLConfig(BaseModel):
+@dataclass(frozen=True)
+class MLConfig:
     """Machine learning configuration with validation."""
-    model_dir: str = Field(default="models/")
-    train_test_split: float = Field(default=0.8, gt=0, lt=1)
-    validation_split: float = Field(default=0.1, gt=0, lt=1)
-    batch_size: int = Field(default=32, ge=1)
-    epochs: int = Field(default=100, ge=1)
-    early_stopping_patience: int = Field(default=10, ge=1)
+    model_dir: str = "models/"
+    train_test_split: float = 0.8
+    validation_split: float = 0.1
+    batch_size: int = 32
+    epochs: int = 100
+    early_stopping_patience: int = 10
+    
+    def __post_init__(self) -> None:
+        _convert_fields(self)
+        for name in ('train_test_split', 'validation_split'):
+            if not 0 < getattr(self, name) < 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.train_test_split + self.validation_split >= 1:
+            raise ValueError("Sum of splits must be less than 1")
+        for name in ('batch_size', 'epochs', 'early_stopping_patience'):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1")
 
-    @field_validator('train_test_split', 'validation_split')
-    @classmethod
-    def validate_splits(cls, v: float, info) -> float:
-        if info.field_name == 'validation_split':
-            train_test = info.data.get('train_test_split', 0.8)
-            if train_test + v >= 1:
-                raise ValueError("Sum of splits must be less than 1")
-        return v
+def _read_json(path: str) -> Any:
+    """Read and parse a JSON file."""
+    return json.loads(read_file(path))
 
 class ConfigManager:
     """Configuration manager for the trading system.
@@ -98,8 +159,11 @@ class ConfigManager:
         Args:
             config_file: Path to the configuration file
         """
+        load_dotenv_once()
         self.config_file = config_file
         self.config = self._load_config()
+        # Validated section models, built on first access
+        self._models: Dict[str, Any] = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file.
@@ -115,16 +179,13 @@ class ConfigManager:
             if not os.path.exists(self.config_file):
                 raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
             
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-            
-            return config
+            return load_cached(self.config_file, _read_json)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing configuration file: {e}")
+            _log().error(f"Error parsing configuration file: {e}")
             raise
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            _log().error(f"Error loading configuration: {e}")
             raise
     
     def get_data_collector_config(self) -> Dict[str, Any]:
@@ -139,7 +200,7 @@ class ConfigManager:
         try:
             return self.config['data_collector']
         except KeyError:
-            logger.error("Data collector configuration not found")
+            _log().error("Data collector configuration not found")
             raise KeyError("Data collector configuration not found in config file")
     
     def get_config(self) -> Dict[str, Any]:
@@ -149,9 +210,53 @@ class ConfigManager:
             Dictionary containing all configuration data
         """
         return self.config
+    
+    def _get_model(self, section: str, model: type) -> Any:
+        """Get a validated configuration section, building it on first access.
+        
+        Args:
+            section: Top-level configuration key
+            model: Model class used to validate the section
+            
+        Returns:
+            Validated model instance
+        """
+        try:
+            return self._models[section]
+        except KeyError:
+            # Keys the model does not define are ignored
+            names = {f.name for f in fields(model)}
+            values = {k: v for k, v in self.config.get(section, {}).items() if k in names}
+            value = self._models[section] = model(**values)
+            return value
+    
+    def get_api_config(self) -> APIConfig:
+        """Get validated API configuration."""
+        return self._get_model('api', APIConfig)
+    
+    def get_database_config(self) -> DatabaseConfig:
+        """Get validated database configuration."""
+        return self._get_model('database', DatabaseConfig)
+    
+    def get_strategy_config(self) -> StrategyConfig:
+        """Get validated strategy configuration."""
+        return self._get_model('strategy', StrategyConfig)
+    
+    def get_ml_config(self) -> MLConfig:
+        """Get validated machine learning configuration."""
+        return self._get_model('ml', MLConfig)
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the shared configuration manager, created once per process.
+    
+    Returns:
+        Process-wide ConfigManager instance
+    """
+    return ConfigManager()
 
-# Create global config instance
-config = ConfigManager()
+# Global config instance, created on first use
+config = LazyProxy(get_config)
 
 # Example usage:
 # from trading.utils.config_manager import config
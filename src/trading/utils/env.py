@@ -0,0 +1,29 @@
+"""
+Environment variable loading shared by the configuration managers.
+"""
+
+import os
+import threading
+
+# Set once the .env file has been loaded into the environment
+_dotenv_loaded = False
+_dotenv_lock = threading.Lock()
+
+# Path of the .env file loaded, exported so subprocesses, which inherit
+# the loaded variables, do not read the same file again
+_DOTENV_MARKER = "TRADING_DOTENV_LOADED"
+
+
+def load_dotenv_once() -> None:
+    """Load environment variables from .env, at most once per process tree."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    with _dotenv_lock:
+        if not _dotenv_loaded:
+            from dotenv import find_dotenv, load_dotenv
+            path = find_dotenv()
+            if path and os.environ.get(_DOTENV_MARKER) != path:
+                if load_dotenv(path):
+                    os.environ[_DOTENV_MARKER] = path
+            _dotenv_loaded = True
@@ -0,0 +1,70 @@
+"""
+Process-wide cache for parsed configuration files.
+"""
+
+import os
+import pickle
+from typing import Any, Callable, Dict, Tuple
+
+# Pickled parse results keyed by absolute path, stored with the
+# (mtime_ns, size) stamp of the file they were parsed from
+_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def read_file(path: str) -> bytes:
+    """Read a whole file with one presized read, bypassing buffered IO.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        File contents
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Regular files rarely return short reads, but it is allowed
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def load_cached(path: str, loader: Callable[[str], Any]) -> Any:
+    """Parse a file, reusing the previous result while it is unchanged on disk.
+
+    Args:
+        path: Path to the file
+        loader: Callable that reads and parses the file at a given path
+
+    Returns:
+        Parsed file contents. Every call returns a private copy, which is
+        much cheaper to unpickle than to deep-copy or parse again.
+
+    Raises:
+        OSError: If the file cannot be accessed
+    """
+    abspath = os.path.abspath(path)
+    st = os.stat(abspath)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _CACHE.get(abspath)
+    if cached is not None and cached[0] == stamp:
+        return pickle.loads(cached[1])
+
+    data = loader(abspath)
+    _CACHE[abspath] = (stamp, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return data
+
+
+def clear_cache() -> None:
+    """Drop all cached file contents."""
+    _CACHE.clear()
@@ -0,0 +1,67 @@
+"""
+Lazily initialised module-level objects.
+"""
+
+import threading
+from typing import Any, Callable, Iterator
+
+
+class LazyProxy:
+    """Proxy that creates its target on first use.
+
+    Attribute access, item access, membership tests, iteration and len()
+    are forwarded to the object returned by the factory, which is called at most once, even across threads.
+    """
+
+    __slots__ = ("_factory", "_target", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        """Initialize the proxy.
+
+        Args:
+            factory: Callable that creates the target object
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_target(self) -> Any:
+        """Get the target object, creating it on first call."""
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = self._factory()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_target(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_target(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get_target(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._get_target()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._get_target()[key] = value
+
+    # Special methods are looked up on the type, bypassing __getattr__
+    def __contains__(self, key: Any) -> bool:
+        return key in self._get_target()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._get_target())
+
+    def __len__(self) -> int:
+        return len(self._get_target())
+
+    def __repr__(self) -> str:
+        if self._target is None:
+            return f"<LazyProxy of {self._factory!r} (not created)>"
+        return repr(self._target)
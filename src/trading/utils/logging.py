@@ -9,10 +9,12 @@ def setup_logging():
     This setup:
     - Removes default logger
     - Adds console handler with colors
-    - Adds file handler with rotation
+    - Adds file handler with rotation, unless logging.file is unset
     - Sets proper log levels
     - Formats messages with timestamps and context
     """
+    level = config.get("logging.level", "INFO")
+    
     # Remove default logger
     logger.remove()
     
@@ -20,30 +22,38 @@ def setup_logging():
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=config.get("logging.level", "INFO"),
+        level=level,
         colorize=True,
     )
     
+    # File logging is disabled when no log file is configured
+    log_file = config.get("logging.file")
+    if not log_file:
+        return logger
+    
+    log_file = Path(log_file)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    
     # Add file handler with rotation
-    log_file = config.get_path("logging.file")
     logger.add(
         str(log_file),
         rotation="500 MB",
         retention="10 days",
         compression="zip",
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-        level=config.get("logging.level", "INFO"),
+        level=level,
+        enqueue=False,
     )
     
     # Add error file handler
-    error_log = log_file.parent / "error.log"
     logger.add(
-        str(error_log),
+        str(log_file.parent / "error.log"),
         rotation="100 MB",
         retention="30 days",
         compression="zip",
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
         level="ERROR",
+        enqueue=False,
     )
     
     return logger
@@ -1,57 +1,105 @@
-import numpy as np
-import pandas as pd
-import yfinance as yf
-import tensorflow as tf
-import torch
-import vectorbt as vbt
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
+import json
+import os
+import re
+import pytest
 from loguru import logger
 
-def test_environment():
-    logger.info("Testing environment setup...")
-    
-    # Test numpy
+# Set SKIP_HEAVY=1 to skip the slow-to-import deep learning and
+# backtesting libraries
+SKIP_HEAVY = bool(os.getenv("SKIP_HEAVY"))
+
+# Hand-written Yahoo Finance chart response for AAPL, served in place
+# of the live API
+YF_CHART = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures", "yf_aapl_1d.json")
+YF_CHART_URL = re.compile(r"https://query[12]\.finance\.yahoo\.com/v8/finance/chart/AAPL")
+
+def _import(name):
+    """Import a module on demand, skipping the check if it is missing."""
+    return pytest.importorskip(name)
+
+def _skip_heavy():
+    """Skip the check if heavy libraries are disabled."""
+    if SKIP_HEAVY:
+        pytest.skip("SKIP_HEAVY is set")
+
+def test_numpy():
+    np = _import("numpy")
     arr = np.array([1, 2, 3, 4, 5])
     logger.info(f"Numpy test: {arr.mean()}")
-    
-    # Test pandas
+
+def test_pandas():
+    pd = _import("pandas")
     df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
     logger.info(f"Pandas test: {df.mean()}")
-    
-    # Test yfinance
-    try:
+
+def test_yfinance():
+    yf = _import("yfinance")
+    responses = _import("responses")
+    with open(YF_CHART) as f:
+        chart = json.load(f)
+    # Unstubbed requests fail instead of reaching Yahoo
+    with responses.RequestsMock() as stub:
+        stub.add(responses.GET, YF_CHART_URL, json=chart)
         ticker = yf.Ticker("AAPL")
         hist = ticker.history(period="1d")
-        logger.info(f"YFinance test: {hist.shape}")
-    except Exception as e:
-        logger.error(f"YFinance test failed: {e}")
-    
-    # Test tensorflow
+    assert hist["Close"].iloc[-1] == pytest.approx(178.85)
+    logger.info(f"YFinance test: {hist.shape}")
+
+def test_tensorflow():
+    _skip_heavy()
+    tf = _import("tensorflow")
     logger.info(f"TensorFlow version: {tf.__version__}")
-    
-    # Test PyTorch
+
+def test_torch():
+    _skip_heavy()
+    torch = _import("torch")
     logger.info(f"PyTorch version: {torch.__version__}")
-    
-    # Test vectorbt
+
+def test_vectorbt():
+    _skip_heavy()
+    vbt = _import("vectorbt")
     logger.info(f"VectorBT version: {vbt.__version__}")
-    
-    # Test matplotlib
+
+def test_matplotlib():
+    plt = _import("matplotlib.pyplot")
     plt.figure()
     plt.plot([1, 2, 3], [1, 2, 3])
     plt.close()
     logger.info("Matplotlib test passed")
-    
-    # Test seaborn
+
+def test_seaborn():
+    sns = _import("seaborn")
     sns.set_theme()
     logger.info("Seaborn test passed")
-    
-    # Test plotly
+
+def test_plotly():
+    px = _import("plotly.express")
     fig = px.line(x=[1, 2, 3], y=[1, 2, 3])
     logger.info("Plotly test passed")
-    
+
+def main():
+    """Run every environment check."""
+    logger.info("Testing environment setup...")
+
+    for check in (
+        test_numpy,
+        test_pandas,
+        test_yfinance,
+        test_tensorflow,
+        test_torch,
+        test_vectorbt,
+        test_matplotlib,
+        test_seaborn,
+        test_plotly,
+    ):
+        try:
+            check()
+        except pytest.skip.Exception as e:
+            logger.warning(f"{check.__name__} skipped: {e}")
+        except Exception as e:
+            logger.error(f"{check.__name__} failed: {e}")
+
     logger.info("All tests completed!")
 
 if __name__ == "__main__":
-    test_environment() 
\ No newline at end of file
+    main()
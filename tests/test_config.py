@@ -0,0 +1,194 @@
+import datetime
+import json
+import os
+import pytest
+import yaml
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+from trading.utils import config as config_module
+from trading.utils.config import ConfigManager
+from trading.utils.file_cache import clear_cache
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Create a temporary YAML config file for testing."""
+    config = {
+        "data": {
+            "raw_data_dir": "test_raw",
+            "symbols": ["AAPL", "MSFT"]
+        },
+        "logging": {
+            "level": "DEBUG"
+        }
+    }
+
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f, Dumper=Dumper)
+
+    return config_path
+
+def test_file_overrides_defaults(config_file):
+    """Test that file values are merged over the defaults."""
+    config = ConfigManager(str(config_file))
+
+    assert config.get("data.raw_data_dir") == "test_raw"
+    assert config.get("data.cache_dir") == "data/cache"
+    assert config.get("data.symbols") == ["AAPL", "MSFT"]
+    assert config.get("logging.level") == "DEBUG"
+    assert config.get("logging")["file"] == "logs/trading.log"
+
+def test_get_default(config_file):
+    """Test that missing keys return the default value."""
+    config = ConfigManager(str(config_file))
+
+    assert config.get("nonexistent.key", "default") == "default"
+    assert config.get("logging.level.nested") is None
+
+def test_set(config_file):
+    """Test that set values are visible through get."""
+    config = ConfigManager(str(config_file))
+
+    config.set("strategy.rsi.period", 21)
+    assert config.get("strategy.rsi.period") == 21
+    assert config.get("strategy") == {"rsi": {"period": 21}}
+
+    config["strategy.rsi"] = {"overbought": 80}
+    assert config["strategy.rsi.overbought"] == 80
+    assert config.get("strategy.rsi.period") is None
+
+def test_in_place_edits(config_file):
+    """Test that edits through returned dicts are visible through get."""
+    config = ConfigManager(str(config_file))
+
+    config.get("logging")["level"] = "ERROR"
+    assert config.get("logging.level") == "ERROR"
+
+    config.config["data"]["symbols"] = ["SPY"]
+    assert config["data.symbols"] == ["SPY"]
+
+def test_dictionary_syntax(config_file):
+    """Test membership checks and missing keys with dictionary syntax."""
+    config = ConfigManager(str(config_file))
+
+    assert "api" in config
+    assert "logging.level" in config
+    assert "logging.missing" not in config
+    assert "logging.level.nested" not in config
+
+    with pytest.raises(KeyError):
+        config["missing"]
+
+def test_namespace_view(config_file):
+    """Test attribute access through the namespace view."""
+    config = ConfigManager(str(config_file))
+
+    assert config.ns.logging.level == "DEBUG"
+    assert config.ns.data.symbols == ["AAPL", "MSFT"]
+
+    config.set("logging.level", "WARNING")
+    assert config.ns.logging.level == "WARNING"
+
+    config.config["logging"]["level"] = "ERROR"
+    assert config.ns.logging.level == "ERROR"
+    assert getattr(config.ns.logging, "missing", "default") == "default"
+
+def test_save_skips_unchanged(config_file):
+    """Test that save only rewrites the file after a change."""
+    config = ConfigManager(str(config_file))
+    mtime = config_file.stat().st_mtime_ns
+
+    config.save()
+    assert config_file.stat().st_mtime_ns == mtime
+
+    config.set("logging.level", "WARNING")
+    config.save()
+    with open(config_file) as f:
+        assert yaml.safe_load(f)["logging"]["level"] == "WARNING"
+
+def test_get_path(config_file, tmp_path):
+    """Test that get_path creates the configured directories."""
+    config = ConfigManager(str(config_file))
+    config.set("data.raw_data_dir", str(tmp_path / "raw"))
+    config.set("logging.file", str(tmp_path / "logs" / "trading.log"))
+
+    data_dir = config.get_path("data.raw_data_dir")
+    assert data_dir.is_dir()
+    assert config.get_path("data.raw_data_dir") is data_dir
+
+    config.set("data.raw_data_dir", str(tmp_path / "raw2"))
+    data_dir = config.get_path("data.raw_data_dir")
+    assert data_dir == tmp_path / "raw2"
+    assert data_dir.is_dir()
+
+    # Edits made in place are picked up too
+    config.config["data"]["raw_data_dir"] = str(tmp_path / "raw3")
+    assert config.get_path("data.raw_data_dir") == tmp_path / "raw3"
+    assert (tmp_path / "raw3").is_dir()
+
+    log_file = config.get_path("logging.file")
+    assert log_file.parent.is_dir()
+    assert not log_file.exists()
+
+    with pytest.raises(KeyError):
+        config.get_path("nonexistent.path")
+
+def test_snapshot(config_file):
+    """Test that a snapshot is used only while it matches the YAML file."""
+    clear_cache()
+    ConfigManager(str(config_file))
+    snapshot = config_file.with_name("config.yaml.json")
+    assert not snapshot.exists()
+
+    # Snapshot stamped with the current YAML file wins
+    st = os.stat(config_file)
+    snapshot.write_text(json.dumps({
+        "source": [st.st_mtime_ns, st.st_size],
+        "config": {"logging": {"level": "ERROR"}},
+    }))
+    clear_cache()
+    assert ConfigManager(str(config_file)).get("logging.level") == "ERROR"
+
+    # An older YAML file copied over the original invalidates it too,
+    # and the snapshot is rewritten from the YAML file
+    older = st.st_mtime_ns - 1_000_000_000
+    os.utime(config_file, ns=(st.st_atime_ns, older))
+    clear_cache()
+    assert ConfigManager(str(config_file)).get("logging.level") == "DEBUG"
+    cached = json.loads(snapshot.read_text())
+    assert cached["source"] == [older, st.st_size]
+    assert cached["config"]["logging"]["level"] == "DEBUG"
+    assert not list(config_file.parent.glob("*.tmp"))
+
+    # So does an edit that leaves the mtime unchanged
+    config_file.write_text("logging:\n  level: WARNING\n")
+    os.utime(config_file, ns=(st.st_atime_ns, older))
+    clear_cache()
+    assert ConfigManager(str(config_file)).get("logging.level") == "WARNING"
+
+    # Values JSON cannot hold unchanged are never written to the snapshot
+    config_file.write_text("logging:\n  level: INFO\nstart: 2024-01-02\n")
+    clear_cache()
+    assert ConfigManager(str(config_file)).get("start") == datetime.date(2024, 1, 2)
+    assert json.loads(snapshot.read_text())["config"]["logging"]["level"] == "WARNING"
+
+def test_snapshot_skips_changed_file(config_file, monkeypatch):
+    """Test that no snapshot is written for a file edited while parsed."""
+    clear_cache()
+    snapshot = config_file.with_name("config.yaml.json")
+    st = os.stat(config_file)
+    snapshot.write_text('{"source": [0, 0], "config": {}}')
+
+    read_yaml = config_module._read_yaml
+
+    def edit_while_parsing(path):
+        data = read_yaml(path)
+        config_file.write_text("logging:\n  level: WARNING\n")
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        return data
+
+    monkeypatch.setattr(config_module, "_read_yaml", edit_while_parsing)
+    assert ConfigManager(str(config_file)).get("logging.level") == "DEBUG"
+    assert snapshot.read_text() == '{"source": [0, 0], "config": {}}'
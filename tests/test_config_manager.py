@@ -1,6 +1,10 @@
 import pytest
 from pathlib import Path
 import yaml
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
 from trading.utils.config_manager import (
     ConfigManager,
     APIConfig,
@@ -49,10 +53,15 @@ def temp_config_file(tmp_path):
     
     config_path = tmp_path / "test_config.yaml"
     with open(config_path, 'w') as f:
-        yaml.dump(config, f)
+        yaml.dump(config, f, Dumper=Dumper)
     
     return config_path
 
+@pytest.fixture(scope="session")
+def default_config_manager():
+    """Create one default-config manager shared by the whole test session."""
+    return ConfigManager("nonexistent.yaml")
+
 def test_config_loading(temp_config_file):
     """Test that config loads correctly from file."""
     config = ConfigManager(str(temp_config_file))
@@ -80,9 +89,9 @@ def test_config_loading(temp_config_file):
     assert ml_config.validation_split == 0.15
     assert ml_config.batch_size == 64
 
-def test_default_config():
+def test_default_config(default_config_manager):
     """Test that default config is loaded when no file exists."""
-    config = ConfigManager("nonexistent.yaml")
+    config = default_config_manager
     
     # Test default API config
     api_config = config.get_api_config()
@@ -99,6 +108,18 @@ def test_config_validation():
     # Test invalid API config
     with pytest.raises(ValueError):
         APIConfig(timeout=0)
+    with pytest.raises(ValueError):
+        APIConfig(retries=0)
+    with pytest.raises(ValueError):
+        APIConfig(retries=11)
+    with pytest.raises(ValueError):
+        APIConfig(rate_limit=0)
+    
+    # Test invalid database config
+    with pytest.raises(ValueError):
+        DatabaseConfig(port=0)
+    with pytest.raises(ValueError):
+        DatabaseConfig(port=65536)
     
     # Test invalid strategy config
     with pytest.raises(ValueError):
@@ -107,10 +128,35 @@ def test_config_validation():
     # Test invalid ML config
     with pytest.raises(ValueError):
         MLConfig(train_test_split=0.9, validation_split=0.2)
+    with pytest.raises(ValueError):
+        MLConfig(batch_size=0)
+    with pytest.raises(ValueError):
+        MLConfig(epochs=0)
+    with pytest.raises(ValueError):
+        MLConfig(early_stopping_patience=0)
+
+def test_config_types():
+    """Test that config values are converted or rejected by type."""
+    # Numeric strings and whole floats are converted
+    assert APIConfig(timeout="5").timeout == 5
+    assert DatabaseConfig(port=8080.0).port == 8080
+    assert MLConfig(validation_split="0.15").validation_split == 0.15
+    
+    # Anything else raises ValueError
+    with pytest.raises(ValueError):
+        APIConfig(timeout="five")
+    with pytest.raises(ValueError):
+        APIConfig(retries=2.5)
+    with pytest.raises(ValueError):
+        DatabaseConfig(host=None)
+    with pytest.raises(ValueError):
+        StrategyConfig(rsi=[14, 70, 30])
+    with pytest.raises(ValueError):
+        StrategyConfig(moving_averages={"short_window": 20})
 
-def test_path_creation():
+def test_path_creation(default_config_manager):
     """Test that paths are created correctly."""
-    config = ConfigManager()
+    config = default_config_manager
     
     # Test data directory creation
     data_dir = config.get_path('data.raw_data_dir')
@@ -122,9 +168,9 @@ def test_path_creation():
     assert log_dir.exists()
     assert log_dir.is_dir()
 
-def test_env_variables(monkeypatch):
+def test_env_variables(default_config_manager, monkeypatch):
     """Test environment variable handling."""
-    config = ConfigManager()
+    config = default_config_manager
     
     # Test existing env var
     monkeypatch.setenv("TEST_VAR", "test_value")
@@ -133,9 +179,9 @@ def test_env_variables(monkeypatch):
     # Test missing env var
     assert config.get_env("NONEXISTENT_VAR", "default") == "default"
 
-def test_dot_notation():
+def test_dot_notation(default_config_manager):
     """Test dot notation access to config values."""
-    config = ConfigManager()
+    config = default_config_manager
     
     # Test nested access
     assert isinstance(config.get('api.timeout'), int)
@@ -35,8 +35,14 @@ def sample_data():
     }
     return pd.DataFrame(data, index=dates)
 
+@pytest.fixture(scope="module")
+def _config_module():
+    """Import the config module once for the whole test module."""
+    import trading.utils.config_manager as module
+    return module
+
 @pytest.fixture
-def data_manager(temp_data_dir, monkeypatch):
+def data_manager(temp_data_dir, _config_module, monkeypatch):
     """Create DataManager instance with temporary directories."""
     # Mock config.get to return temporary paths
     def mock_get(key, default=None):
@@ -48,7 +54,7 @@ def data_manager(temp_data_dir, monkeypatch):
             return str(temp_data_dir["cache"])
         return default
     
-    monkeypatch.setattr("trading.utils.config_manager.config.get", mock_get)
+    monkeypatch.setattr(_config_module.config, "get", mock_get)
     
     return DataManager()
 
@@ -153,25 +159,22 @@ def test_get_data_gaps(data_manager, sample_data):
     assert gaps[0][0] == datetime(2024, 1, 1)
     assert gaps[0][1] == datetime(2024, 1, 10)
 
-def test_invalid_data(data_manager):
-    """Test handling invalid data."""
+@pytest.mark.parametrize("invalid_data", [
     # Empty DataFrame
-    with pytest.raises(ValueError):
-        data_manager.save_data(pd.DataFrame(), "AAPL", "1d")
-    
+    pd.DataFrame(),
     # Missing columns
-    invalid_data = pd.DataFrame({"open": [100.0]})
-    with pytest.raises(ValueError):
-        data_manager.save_data(invalid_data, "AAPL", "1d")
-    
+    pd.DataFrame({"open": [100.0]}),
     # Non-datetime index
-    invalid_data = pd.DataFrame({
+    pd.DataFrame({
         "open": [100.0],
         "high": [105.0],
         "low": [95.0],
         "close": [102.0],
         "volume": [1000]
-    }, index=[0])
+    }, index=[0]),
+], ids=["empty", "missing_columns", "non_datetime_index"])
+def test_invalid_data(data_manager, invalid_data):
+    """Test handling invalid data."""
     with pytest.raises(ValueError):
         data_manager.save_data(invalid_data, "AAPL", "1d")
 
@@ -0,0 +1,63 @@
+import os
+import pytest
+import yaml
+from trading.utils.file_cache import load_cached, clear_cache, read_file
+
+def read_yaml(path):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Create a temporary YAML file and start from an empty cache."""
+    clear_cache()
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: INFO\n")
+    yield path
+    clear_cache()
+
+def test_cache_hit(yaml_file):
+    """Test that an unchanged file is parsed only once."""
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return read_yaml(path)
+
+    first = load_cached(str(yaml_file), loader)
+    second = load_cached(str(yaml_file), loader)
+
+    assert first == {"logging": {"level": "INFO"}}
+    assert second == first
+    assert len(calls) == 1
+
+def test_cache_returns_copies(yaml_file):
+    """Test that callers cannot modify each other's results."""
+    first = load_cached(str(yaml_file), read_yaml)
+    first["logging"]["level"] = "DEBUG"
+
+    assert load_cached(str(yaml_file), read_yaml) == {"logging": {"level": "INFO"}}
+
+def test_cache_invalidation(yaml_file):
+    """Test that a modified file is parsed again."""
+    load_cached(str(yaml_file), read_yaml)
+
+    yaml_file.write_text("logging:\n  level: DEBUG\n")
+    st = os.stat(yaml_file)
+    os.utime(yaml_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_cached(str(yaml_file), read_yaml) == {"logging": {"level": "DEBUG"}}
+
+def test_missing_file(tmp_path):
+    """Test that a missing file raises an error."""
+    with pytest.raises(OSError):
+        load_cached(str(tmp_path / "missing.yaml"), read_yaml)
+
+def test_read_file(tmp_path):
+    """Test reading whole files as bytes."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 100000)
+    assert read_file(str(path)) == b"x" * 100000
+
+    path.write_bytes(b"")
+    assert read_file(str(path)) == b""
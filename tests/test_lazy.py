@@ -0,0 +1,79 @@
+import threading
+from trading.utils.config import ConfigManager
+from trading.utils.lazy import LazyProxy
+
+class Target:
+    """Simple object used as a proxy target."""
+
+    def __init__(self):
+        self.value = 1
+        self.items = {"a": 1}
+
+    def __getitem__(self, key):
+        return self.items[key]
+
+    def __setitem__(self, key, value):
+        self.items[key] = value
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+def test_created_on_first_use():
+    """Test that the factory only runs on first access."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return Target()
+
+    proxy = LazyProxy(factory)
+    assert calls == []
+
+    assert proxy.value == 1
+    assert proxy["a"] == 1
+    assert len(calls) == 1
+
+def test_forwards_assignment():
+    """Test that attribute and item assignment reach the target."""
+    target = Target()
+    proxy = LazyProxy(lambda: target)
+
+    proxy.value = 2
+    proxy["b"] = 3
+    assert target.value == 2
+    assert target.items["b"] == 3
+
+def test_forwards_container_protocol():
+    """Test that membership, iteration and len() reach the target."""
+    proxy = LazyProxy(Target)
+
+    assert "a" in proxy
+    assert "b" not in proxy
+    assert list(proxy) == ["a"]
+    assert len(proxy) == 1
+
+def test_config_membership(tmp_path):
+    """Test membership tests through a proxied ConfigManager."""
+    proxy = LazyProxy(lambda: ConfigManager(str(tmp_path / "missing.yaml")))
+
+    assert "logging.level" in proxy
+    assert "logging.missing" not in proxy
+
+def test_created_once_across_threads():
+    """Test that concurrent first access creates a single target."""
+    calls = []
+    proxy = LazyProxy(lambda: calls.append(1) or Target())
+
+    threads = [threading.Thread(target=lambda: proxy.value) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1